@@ -58,9 +58,16 @@ def _daemon_url(path: str) -> str:
     return f"http://127.0.0.1:{DAEMON_PORT}{path}"
 
 
+# Process-wide session: CLI commands often hit the daemon several times in a
+# row (polling until it is up, resolving a name, then issuing the call), and a
+# shared Session reuses one keep-alive connection instead of opening a fresh
+# TCP socket per request.
+_http = requests.Session()
+
+
 def _daemon_available(timeout: float = 2.0) -> bool:
     try:
-        requests.get(_daemon_url("/sessions"), timeout=timeout)
+        _http.get(_daemon_url("/sessions"), timeout=timeout)
         return True
     except requests.RequestException:
         return False
@@ -167,7 +174,7 @@ def _show_daemon_error_details() -> None:
 def _fetch_session_token(port: int, timeout: float = 2.0) -> str | None:
     """Try to fetch the token for a running session (local only)."""
     try:
-        resp = requests.get(f"http://127.0.0.1:{port}/token", timeout=timeout)
+        resp = _http.get(f"http://127.0.0.1:{port}/token", timeout=timeout)
         resp.raise_for_status()
         return resp.json().get("token")
     except requests.RequestException:
@@ -179,7 +186,7 @@ def _fetch_session_token(port: int, timeout: float = 2.0) -> str | None:
 def _get_session_entry(port: int) -> dict | None:
     """Return daemon session info for a specific port."""
     try:
-        resp = requests.get(_daemon_url("/sessions"), timeout=5)
+        resp = _http.get(_daemon_url("/sessions"), timeout=5)
         resp.raise_for_status()
         sessions = resp.json()
     except requests.RequestException:
@@ -207,7 +214,7 @@ def _get_error_detail(response: requests.Response | None) -> str:
 def _resolve_name(name: str) -> int:
     """Resolve session name to port via daemon API."""
     try:
-        resp = requests.get(_daemon_url(f"/resolve/{name}"), timeout=2)
+        resp = _http.get(_daemon_url(f"/resolve/{name}"), timeout=2)
         if resp.status_code == 404:
             raise click.ClickException(f"Session '{name}' not found")
         resp.raise_for_status()
@@ -230,7 +237,13 @@ SESSION_REGISTRY: dict[int, SilcSession] = {}
 
 def _build_server(session: SilcSession, host: str) -> uvicorn.Server:
     app = create_app(session)
-    config = uvicorn.Config(app, host=host, port=session.port, log_level="info")
+    config = uvicorn.Config(
+        app,
+        host=host,
+        port=session.port,
+        log_level="info",
+        ws_per_message_deflate=False,
+    )
     return uvicorn.Server(config)
 
 
@@ -383,7 +396,7 @@ def start(
         else:
             # Try to connect to verify it's responsive
             try:
-                requests.get(_daemon_url("/sessions"), timeout=2)
+                _http.get(_daemon_url("/sessions"), timeout=2)
                 click.echo("✓ Daemon is running and responsive", err=False)
             except requests.RequestException:
                 # Daemon is not responsive
@@ -455,7 +468,7 @@ def start(
 
         # Check for collision with existing sessions
         try:
-            existing = requests.get(_daemon_url("/sessions"), timeout=2)
+            existing = _http.get(_daemon_url("/sessions"), timeout=2)
             existing_names = (
                 {s["name"] for s in existing.json()} if existing.ok else set()
             )
@@ -485,7 +498,7 @@ def start(
             payload["shell"] = shell
         if cwd:
             payload["cwd"] = cwd
-        resp = requests.post(_daemon_url("/sessions"), json=payload, timeout=5)
+        resp = _http.post(_daemon_url("/sessions"), json=payload, timeout=5)
         resp.raise_for_status()
         session = resp.json()
         session_name = session.get("name", "N/A")
@@ -585,7 +598,7 @@ def out(ctx: click.Context, lines: int) -> None:
     """Fetch the latest output."""
     port = ctx.parent.params["port"] if ctx.parent else 0 if ctx.parent else 0
     try:
-        resp = requests.get(
+        resp = _http.get(
             f"http://127.0.0.1:{port}/out", params={"lines": lines}, timeout=5
         )
         if resp.status_code == 410:
@@ -605,7 +618,7 @@ def in_(ctx: click.Context, text: tuple[str, ...]) -> None:
     port = ctx.parent.params["port"] if ctx.parent else 0 if ctx.parent else 0
     text_str = " ".join(text)
     try:
-        resp = requests.post(
+        resp = _http.post(
             f"http://127.0.0.1:{port}/in",
             data=text_str.encode("utf-8"),
             headers={"Content-Type": "text/plain; charset=utf-8"},
@@ -629,7 +642,7 @@ def run(ctx: click.Context, command: tuple[str, ...], timeout: int) -> None:
     port = ctx.parent.params["port"] if ctx.parent else 0
     cmd = " ".join(command)
     try:
-        resp = requests.post(
+        resp = _http.post(
             f"http://127.0.0.1:{port}/run",
             json={"command": cmd, "timeout": timeout},
             timeout=120,
@@ -652,7 +665,7 @@ def status(ctx: click.Context) -> None:
     """Show session status."""
     port = ctx.parent.params["port"] if ctx.parent else 0
     try:
-        resp = requests.get(f"http://127.0.0.1:{port}/status", timeout=5)
+        resp = _http.get(f"http://127.0.0.1:{port}/status", timeout=5)
         if resp.status_code == 410:
             click.echo(f"❌ Session on port {port} has ended", err=True)
             return
@@ -677,7 +690,7 @@ def clear(ctx: click.Context) -> None:
     """Clear the session terminal."""
     port = ctx.parent.params["port"] if ctx.parent else 0
     try:
-        resp = requests.post(f"http://127.0.0.1:{port}/clear", timeout=5)
+        resp = _http.post(f"http://127.0.0.1:{port}/clear", timeout=5)
         if resp.status_code == 410:
             click.echo(f"❌ Session on port {port} has ended", err=True)
             return
@@ -693,7 +706,7 @@ def reset(ctx: click.Context) -> None:
     """Reset the session terminal."""
     port = ctx.parent.params["port"] if ctx.parent else 0
     try:
-        resp = requests.post(f"http://127.0.0.1:{port}/reset", timeout=5)
+        resp = _http.post(f"http://127.0.0.1:{port}/reset", timeout=5)
         if resp.status_code == 410:
             click.echo(f"❌ Session on port {port} has ended", err=True)
             return
@@ -709,7 +722,7 @@ def interrupt(ctx: click.Context) -> None:
     """Send interrupt signal (Ctrl+C) to the session."""
     port = ctx.parent.params["port"] if ctx.parent else 0
     try:
-        resp = requests.post(f"http://127.0.0.1:{port}/interrupt", timeout=5)
+        resp = _http.post(f"http://127.0.0.1:{port}/interrupt", timeout=5)
         if resp.status_code == 410:
             click.echo(f"❌ Session on port {port} has ended", err=True)
             return
@@ -727,7 +740,7 @@ def resize(ctx: click.Context, rows: int, cols: int) -> None:
     """Resize the session terminal."""
     port = ctx.parent.params["port"] if ctx.parent else 0
     try:
-        resp = requests.post(
+        resp = _http.post(
             f"http://127.0.0.1:{port}/resize",
             params={"rows": rows, "cols": cols},
             timeout=5,
@@ -747,7 +760,7 @@ def close(ctx: click.Context) -> None:
     """Gracefully close the session."""
     port = ctx.parent.params["port"] if ctx.parent else 0
     try:
-        resp = requests.post(_daemon_url(f"/sessions/{port}/close"), timeout=5)
+        resp = _http.post(_daemon_url(f"/sessions/{port}/close"), timeout=5)
         if resp.status_code == 404:
             click.echo(f"Error: Session on port {port} not found", err=True)
             sys.exit(1)
@@ -764,7 +777,7 @@ def kill(ctx: click.Context) -> None:
     """Force kill the session."""
     port = ctx.parent.params["port"] if ctx.parent else 0
     try:
-        resp = requests.post(_daemon_url(f"/sessions/{port}/kill"), timeout=5)
+        resp = _http.post(_daemon_url(f"/sessions/{port}/kill"), timeout=5)
         if resp.status_code == 404:
             click.echo(f"Error: Session on port {port} not found", err=True)
             sys.exit(1)
@@ -781,7 +794,7 @@ def restart_session(ctx: click.Context) -> None:
     """Restart session with same port/name/cwd/shell."""
     port = ctx.parent.params["port"] if ctx.parent else 0
     try:
-        resp = requests.post(_daemon_url(f"/sessions/{port}/restart"), timeout=10)
+        resp = _http.post(_daemon_url(f"/sessions/{port}/restart"), timeout=10)
         if resp.status_code == 404:
             click.echo(f"Error: Session on port {port} not found", err=True)
             sys.exit(1)
@@ -797,7 +810,7 @@ def restart_session(ctx: click.Context) -> None:
 def list_sessions() -> None:
     """List all active sessions."""
     try:
-        resp = requests.get(_daemon_url("/sessions"), timeout=5)
+        resp = _http.get(_daemon_url("/sessions"), timeout=5)
         sessions = resp.json()
 
         if not sessions:
@@ -829,7 +842,7 @@ def shutdown() -> None:
 
     try:
         # Daemon side is bounded (~30s), but give a small cushion.
-        requests.post(_daemon_url("/shutdown"), timeout=35)
+        _http.post(_daemon_url("/shutdown"), timeout=35)
     except requests.RequestException:
         click.echo("SILC daemon is not running")
         return
@@ -853,7 +866,7 @@ def killall() -> None:
 
     # Best-effort API call first (lets daemon clean logs/ports), but never rely on it.
     try:
-        requests.post(_daemon_url("/killall"), timeout=3)
+        _http.post(_daemon_url("/killall"), timeout=3)
     except requests.RequestException:
         pass
 
@@ -866,7 +879,7 @@ def killall() -> None:
 def restart_server() -> None:
     """Restart the daemon HTTP server (sessions survive)."""
     try:
-        resp = requests.post(_daemon_url("/restart-server"), timeout=5)
+        resp = _http.post(_daemon_url("/restart-server"), timeout=5)
         resp.raise_for_status()
         click.echo("✨ Daemon HTTP server restarted (sessions preserved)")
     except requests.RequestException as e:
@@ -877,7 +890,7 @@ def restart_server() -> None:
 def resurrect() -> None:
     """Restore sessions from previous state."""
     try:
-        resp = requests.post(_daemon_url("/resurrect"), timeout=30)
+        resp = _http.post(_daemon_url("/resurrect"), timeout=30)
         resp.raise_for_status()
         result = resp.json()
 
@@ -913,7 +926,7 @@ def restart() -> None:
     """Shutdown daemon and immediately restart (resurrects sessions)."""
     # Graceful shutdown
     try:
-        requests.post(_daemon_url("/shutdown"), timeout=35)
+        _http.post(_daemon_url("/shutdown"), timeout=35)
     except requests.RequestException:
         pass
 
@@ -1082,7 +1095,7 @@ def logs(ctx: click.Context, tail: int) -> None:
     """Show session logs."""
     port = ctx.parent.params["port"] if ctx.parent else 0
     try:
-        resp = requests.get(
+        resp = _http.get(
             f"http://127.0.0.1:{port}/logs", params={"tail": tail}, timeout=5
         )
         if resp.status_code == 410:
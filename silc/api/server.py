@@ -5,8 +5,11 @@ from __future__ import annotations
 import asyncio
 import json
 import sys
+import time
+from functools import lru_cache
 from ipaddress import AddressValueError, ip_address
 from pathlib import Path
+from typing import Any
 
 from fastapi import (
     Depends,
@@ -16,7 +19,7 @@ from fastapi import (
     WebSocket,
     WebSocketDisconnect,
 )
-from fastapi.responses import HTMLResponse, StreamingResponse
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 
 from ..core.cleaner import clean_output
 from ..core.session import SilcSession
@@ -24,34 +27,55 @@ from ..stream import api_endpoints
 from ..stream.streaming_service import StreamingService
 from ..utils.persistence import read_session_log
 
+# Pre-encoded SSE framing so the /stream generator can yield bytes directly.
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+
+# Fast path for the overwhelmingly common local peers; anything else falls
+# through to full ipaddress parsing (cached per remote peer).
+_LOCAL_HOSTS = frozenset({"localhost", "127.0.0.1", "::1", "0:0:0:0:0:0:0:1"})
+
+# Platform newline appended to typed input; computed once, not per message.
+_INPUT_NEWLINE = "\r\n" if sys.platform == "win32" else "\n"
+
+# How long a serialized /status body may be reused between polls (seconds).
+_STATUS_CACHE_TTL = 0.05
+
+
+@lru_cache(maxsize=128)
+def _is_loopback_address(host: str) -> bool:
+    if "%" in host:
+        host = host.split("%", 1)[0]
+    try:
+        addr = ip_address(host)
+    except AddressValueError:
+        return False
+    if addr.is_loopback:
+        return True
+    ipv4_mapped = getattr(addr, "ipv4_mapped", None)
+    if ipv4_mapped and ipv4_mapped.is_loopback:
+        return True
+    return False
+
 
 def create_app(session: SilcSession) -> FastAPI:
     def _client_is_local(host: str | None) -> bool:
         if not host:
             return False
-        if host.lower() == "localhost":
-            return True
-        if "%" in host:
-            host = host.split("%", 1)[0]
-        try:
-            addr = ip_address(host)
-        except AddressValueError:
-            return False
-        if addr.is_loopback:
+        if host in _LOCAL_HOSTS or host.lower() == "localhost":
             return True
-        ipv4_mapped = getattr(addr, "ipv4_mapped", None)
-        if ipv4_mapped and ipv4_mapped.is_loopback:
+        return _is_loopback_address(host)
+
+    def _auth_exempt(client: tuple[str, int] | None) -> bool:
+        """True when no token is configured or the peer is local."""
+        if not session.api_token:
             return True
-        return False
+        return _client_is_local(client[0] if client else None)
 
     def _require_token(request: Request) -> None:
-        token = session.api_token
-        if not token:
-            return
-        client = request.client
-        client_host = client[0] if client else None
-        if _client_is_local(client_host):
+        if _auth_exempt(request.client):
             return
+        token = session.api_token
 
         auth_header = request.headers.get("authorization")
         if not auth_header:
@@ -66,15 +90,10 @@ def create_app(session: SilcSession) -> FastAPI:
             raise HTTPException(status_code=403, detail="Invalid API token")
 
     def _verify_websocket_token(websocket: WebSocket) -> bool:
-        token = session.api_token
-        if not token:
-            return True
-        client = websocket.client
-        client_host = client[0] if client else None
-        if _client_is_local(client_host):
+        if _auth_exempt(websocket.client):
             return True
         provided = websocket.query_params.get("token")
-        return provided == token
+        return provided == session.api_token
 
     app = FastAPI(
         title=f"SILC Session {session.session_id}",
@@ -100,31 +119,46 @@ def create_app(session: SilcSession) -> FastAPI:
         if not session.get_status()["alive"]:
             raise HTTPException(status_code=410, detail="Session has ended")
 
+    def _count_lines(text: str) -> int:
+        """Count logical lines without materializing a list of them."""
+        if not text:
+            return 0
+        return text.count("\n") + (0 if text.endswith("\n") else 1)
+
+    # TUIs poll /status aggressively; serve the serialized body from a short
+    # TTL cache so N polls per tick collapse into one render + one dump.
+    status_cache: dict[str, Any] = {"at": 0.0, "body": b""}
+
     @app.get("/status", dependencies=[Depends(_require_token)])
-    async def get_status() -> dict:
+    async def get_status() -> Response:
+        now = time.monotonic()
+        if status_cache["body"] and now - status_cache["at"] < _STATUS_CACHE_TTL:
+            return Response(status_cache["body"], media_type="application/json")
         status = session.get_status()
         if not status["alive"]:
             raise HTTPException(status_code=410, detail="Session has ended")
-        return status
+        body = json.dumps(status).encode("utf-8")
+        status_cache["at"] = now
+        status_cache["body"] = body
+        return Response(body, media_type="application/json")
 
     @app.get("/out", dependencies=[Depends(_require_token)])
     async def get_output(lines: int = 100) -> dict:
         _check_alive()
         output = session.get_output(lines)
-        return {"output": output, "lines": len(output.splitlines())}
+        return {"output": output, "lines": _count_lines(output)}
 
     @app.get("/raw", dependencies=[Depends(_require_token)])
     async def get_raw_output(lines: int = 100) -> dict:
         _check_alive()
         output = session.get_output(lines, raw=True)
-        return {"output": output, "lines": len(output.splitlines())}
+        return {"output": output, "lines": _count_lines(output)}
 
     @app.get("/logs", dependencies=[Depends(_require_token)])
     async def get_logs(tail: int = 100) -> dict:
         _check_alive()
         log_content = read_session_log(session.port, tail_lines=tail)
-        lines = log_content.splitlines() if log_content else []
-        return {"logs": log_content, "lines": len(lines)}
+        return {"logs": log_content, "lines": _count_lines(log_content)}
 
     @app.get("/stream", dependencies=[Depends(_require_token)])
     async def stream_output() -> StreamingResponse:
@@ -137,7 +171,8 @@ def create_app(session: SilcSession) -> FastAPI:
                 if new_bytes:
                     decoded = new_bytes.decode("utf-8", errors="replace").splitlines()
                     if decoded:
-                        yield f"data: {clean_output(decoded)}\n\n"
+                        cleaned = clean_output(decoded).encode("utf-8")
+                        yield _SSE_PREFIX + cleaned + _SSE_SUFFIX
                 await asyncio.sleep(0.5)
 
         return StreamingResponse(generator(), media_type="text/event-stream")
@@ -153,7 +188,7 @@ def create_app(session: SilcSession) -> FastAPI:
 
         # Add platform line ending (unless nonewline flag)
         if not nonewline:
-            text += "\r\n" if sys.platform == "win32" else "\n"
+            text += _INPUT_NEWLINE
 
         await session.write_input(text)
         return {"status": "sent"}
@@ -167,15 +202,22 @@ def create_app(session: SilcSession) -> FastAPI:
                 "error": "No command provided",
                 "status": "bad_request",
             }
-        text = body.decode("utf-8", errors="replace")
-        command = text
+        command = body.decode("utf-8", errors="replace")
         resolved_timeout = timeout
-        try:
-            payload = json.loads(text)
-            command = payload.get("command", "")
-            resolved_timeout = payload.get("timeout", timeout)
-        except json.JSONDecodeError:
-            pass
+
+        # Only attempt a JSON parse when the request declares JSON or the
+        # body plausibly is JSON; plain-text commands skip the speculative
+        # parse-and-except entirely.
+        content_type = request.headers.get("content-type", "")
+        if "json" in content_type.lower() or body.lstrip()[:1] == b"{":
+            try:
+                payload = json.loads(body)
+            except json.JSONDecodeError:
+                pass
+            else:
+                if isinstance(payload, dict):
+                    command = payload.get("command", "")
+                    resolved_timeout = payload.get("timeout", timeout)
 
         command = command.rstrip("\r\n")
         return await session.run_command(command, resolved_timeout)
@@ -232,43 +274,64 @@ def create_app(session: SilcSession) -> FastAPI:
         session.tui_active = True
 
         send_lock = asyncio.Lock()
+        # Per-client queue fed by the session's single read-loop producer; the
+        # writer merges queued bursts (up to 64 KiB) into one frame per send.
+        out_queue = session.subscribe_output()
 
         async def safe_send(payload: dict[str, str]) -> None:
             async with send_lock:
                 await websocket.send_json(payload)
 
         async def send_updates() -> None:
-            cursor = session.buffer.cursor
             while True:
-                new_bytes, cursor = session.buffer.get_since(cursor)
-                if new_bytes:
+                chunk = await out_queue.get()
+                overflow = chunk is None
+                chunks: list[bytes] = []
+                total = 0
+                if chunk is not None:
+                    chunks = [chunk]
+                    total = len(chunk)
+                    while not out_queue.empty() and total < 64 * 1024:
+                        nxt = out_queue.get_nowait()
+                        if nxt is None:
+                            overflow = True
+                            break
+                        chunks.append(nxt)
+                        total += len(nxt)
+                if chunks:
                     await safe_send(
                         {
                             "event": "update",
-                            "data": new_bytes.decode("utf-8", errors="replace"),
+                            "data": b"".join(chunks).decode("utf-8", errors="replace"),
                         }
                     )
-                await asyncio.sleep(0.1)
+                if overflow:
+                    # Client is not draining; close instead of buffering
+                    # output without bound.
+                    await websocket.close(code=1013, reason="Client too slow")
+                    return
 
-        sender_task = asyncio.create_task(send_updates())
-        try:
+        async def receive_loop() -> None:
             while True:
-                data = await websocket.receive_text()
+                # Accept binary frames without Starlette's text decode +
+                # UTF-8 validation pass; json.loads handles bytes directly.
+                received = await websocket.receive()
+                if received.get("type") == "websocket.disconnect":
+                    return
+                data = received.get("bytes")
+                if data is None:
+                    data = received.get("text", "")
                 try:
                     message = json.loads(data)
+                    if not isinstance(message, dict):
+                        continue
                     event_type = message.get("event")
                     if event_type == "type":
                         text = message.get("text", "")
-                        nonewline = message.get("nonewline", False)
-
-                        if nonewline:
-                            await session.write_input(text)
-                        else:
+                        if not message.get("nonewline", False):
                             # Match /in endpoint behavior: strip newlines, add platform newline
-                            text = text.rstrip("\r\n")
-                            newline = "\r\n" if sys.platform == "win32" else "\n"
-                            text += newline
-                            await session.write_input(text)
+                            text = text.rstrip("\r\n") + _INPUT_NEWLINE
+                        await session.write_input(text)
                     elif event_type == "load_history":
                         raw_bytes = session.buffer.get_bytes()
                         await safe_send(
@@ -279,15 +342,19 @@ def create_app(session: SilcSession) -> FastAPI:
                         )
                 except json.JSONDecodeError:
                     pass
-        except WebSocketDisconnect:
-            pass
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                sender_task = tg.create_task(send_updates())
+                try:
+                    await receive_loop()
+                except WebSocketDisconnect:
+                    pass
+                finally:
+                    sender_task.cancel()
         finally:
             session.tui_active = False
-            sender_task.cancel()
-            try:
-                await sender_task
-            except asyncio.CancelledError:
-                pass
+            session.unsubscribe_output(out_queue)
 
     @app.get("/web", response_class=HTMLResponse)
     async def web_ui() -> HTMLResponse:
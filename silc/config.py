@@ -12,14 +12,14 @@ from __future__ import annotations
 
 import os
 import sys
-from dataclasses import dataclass, field
+import threading
+import tomllib
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
-import toml
 
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PortConfig:
     """Port range configuration."""
 
@@ -30,7 +30,7 @@ class PortConfig:
     max_attempts: int = 10
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PathConfig:
     """Directory path configuration."""
 
@@ -38,7 +38,7 @@ class PathConfig:
     log_dir: Path | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TLSConfig:
     """TLS/SSL configuration."""
 
@@ -47,7 +47,7 @@ class TLSConfig:
     key_path: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TokenConfig:
     """API token configuration."""
 
@@ -55,7 +55,7 @@ class TokenConfig:
     require_token: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SessionConfig:
     """Session behavior configuration."""
 
@@ -65,7 +65,7 @@ class SessionConfig:
     gc_interval: int = 60  # 1 minute
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LoggingConfig:
     """Logging configuration."""
 
@@ -73,7 +73,7 @@ class LoggingConfig:
     log_level: str = "INFO"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Config:
     """Main configuration container."""
 
@@ -86,55 +86,105 @@ class Config:
 
     def __post_init__(self) -> None:
         """Resolve paths after initialization."""
-        if self.paths.data_dir is None:
+        data_dir = self.paths.data_dir
+        log_dir = self.paths.log_dir
+        if data_dir is None:
             # Resolve data directory from environment or use default
             data_dir_str = os.environ.get("SILC_DATA_DIR")
             if data_dir_str:
-                self.paths.data_dir = Path(data_dir_str)
+                data_dir = Path(data_dir_str)
             else:
                 # Default: ~/.silc on Unix or %APPDATA%/silc on Windows
                 if sys.platform == "win32":
-                    self.paths.data_dir = Path(os.environ.get("APPDATA", "")) / "silc"
+                    data_dir = Path(os.environ.get("APPDATA", "")) / "silc"
                 else:
-                    self.paths.data_dir = Path.home() / ".silc"
-        if self.paths.log_dir is None:
-            self.paths.log_dir = self.paths.data_dir / "logs"
-
-
-def _get_env_int(key: str, default: int) -> int:
-    """Get integer from environment variable."""
-    value = os.environ.get(key)
-    if value is not None:
-        try:
-            return int(value)
-        except ValueError:
-            pass
-    return default
+                    data_dir = Path.home() / ".silc"
+        if log_dir is None:
+            log_dir = data_dir / "logs"
+        if data_dir is not self.paths.data_dir or log_dir is not self.paths.log_dir:
+            # Frozen dataclass: bypass __setattr__ for the resolved value.
+            object.__setattr__(
+                self, "paths", PathConfig(data_dir=data_dir, log_dir=log_dir)
+            )
 
 
-def _get_env_bool(key: str, default: bool) -> bool:
-    """Get boolean from environment variable."""
-    value = os.environ.get(key)
-    if value is not None:
-        return value.lower() in ("1", "true", "yes", "on")
-    return default
+# Sentinel for env values that fail coercion; the existing setting is kept.
+_SKIP = object()
 
 
-def _get_env_str(key: str, default: str | None) -> str | None:
-    """Get string from environment variable."""
-    return os.environ.get(key, default)
-
-
-def _get_env_path(key: str, default: Path | None) -> Path | None:
-    """Get path from environment variable."""
-    value = os.environ.get(key)
-    if value:
-        return Path(value)
-    return default
+def _coerce_int(value: str) -> Any:
+    try:
+        return int(value)
+    except ValueError:
+        return _SKIP
+
+
+def _coerce_bool(value: str) -> bool:
+    return value.lower() in ("1", "true", "yes", "on")
+
+
+def _coerce_str(value: str) -> str:
+    return value
+
+
+def _coerce_nonempty_str(value: str) -> Any:
+    return value if value else _SKIP
+
+
+def _coerce_path(value: str) -> Any:
+    return Path(value) if value else _SKIP
+
+
+# Flat override schema: config section -> ((env var, field, coercer), ...).
+_ENV_TABLE: dict[str, tuple[tuple[str, str, Any], ...]] = {
+    "ports": (
+        ("SILC_DAEMON_PORT_START", "daemon_start", _coerce_int),
+        ("SILC_DAEMON_PORT_END", "daemon_end", _coerce_int),
+        ("SILC_SESSION_PORT_START", "session_start", _coerce_int),
+        ("SILC_SESSION_PORT_END", "session_end", _coerce_int),
+        ("SILC_PORT_MAX_ATTEMPTS", "max_attempts", _coerce_int),
+    ),
+    "paths": (
+        ("SILC_DATA_DIR", "data_dir", _coerce_path),
+        ("SILC_LOG_DIR", "log_dir", _coerce_path),
+    ),
+    "tls": (
+        ("SILC_TLS_ENABLED", "enabled", _coerce_bool),
+        ("SILC_TLS_CERT_PATH", "cert_path", _coerce_str),
+        ("SILC_TLS_KEY_PATH", "key_path", _coerce_str),
+    ),
+    "tokens": (
+        ("SILC_TOKEN_LENGTH", "length", _coerce_int),
+        ("SILC_REQUIRE_TOKEN", "require_token", _coerce_bool),
+    ),
+    "sessions": (
+        ("SILC_COMMAND_TIMEOUT", "default_timeout", _coerce_int),
+        ("SILC_MAX_BUFFER_BYTES", "max_buffer_bytes", _coerce_int),
+        ("SILC_IDLE_TIMEOUT", "idle_timeout", _coerce_int),
+        ("SILC_GC_INTERVAL", "gc_interval", _coerce_int),
+    ),
+    "logging": (
+        ("SILC_MAX_LOG_LINES", "max_log_lines", _coerce_int),
+        ("SILC_LOG_LEVEL", "log_level", _coerce_nonempty_str),
+    ),
+}
+
+
+# Parsed silc.toml memoized by (path, mtime) so repeated load_config calls
+# skip the read and parse until the file actually changes. A missing file is
+# remembered too, so the common no-config case costs one stat per process;
+# reload_config() drops both caches to pick up a newly created file.
+_file_cache: tuple[tuple[str, int], dict[str, Any]] | None = None
+_file_missing = False
 
 
 def _load_config_file() -> dict[str, Any]:
     """Load configuration from silc.toml file."""
+    global _file_cache, _file_missing
+
+    if _file_missing:
+        return {}
+
     # Resolve data directory directly (avoiding circular import)
     if sys.platform == "win32":
         data_dir = Path(os.environ.get("APPDATA", "")) / "silc"
@@ -142,130 +192,62 @@ def _load_config_file() -> dict[str, Any]:
         data_dir = Path.home() / ".silc"
 
     config_path = data_dir / "silc.toml"
-    if not config_path.exists():
-        return {}
-
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            return toml.load(f)
-    except (OSError, toml.TomlDecodeError):
+        mtime_ns = config_path.stat().st_mtime_ns
+    except OSError:
+        _file_missing = True
         return {}
 
+    cache_key = (str(config_path), mtime_ns)
+    if _file_cache is not None and _file_cache[0] == cache_key:
+        return _file_cache[1]
 
-def _apply_env_overrides(config: Config) -> Config:
-    """Apply environment variable overrides to config."""
-    # Port overrides
-    config.ports.daemon_start = _get_env_int(
-        "SILC_DAEMON_PORT_START", config.ports.daemon_start
-    )
-    config.ports.daemon_end = _get_env_int(
-        "SILC_DAEMON_PORT_END", config.ports.daemon_end
-    )
-    config.ports.session_start = _get_env_int(
-        "SILC_SESSION_PORT_START", config.ports.session_start
-    )
-    config.ports.session_end = _get_env_int(
-        "SILC_SESSION_PORT_END", config.ports.session_end
-    )
-    config.ports.max_attempts = _get_env_int(
-        "SILC_PORT_MAX_ATTEMPTS", config.ports.max_attempts
-    )
-
-    # Path overrides
-    config.paths.data_dir = _get_env_path("SILC_DATA_DIR", config.paths.data_dir)
-    config.paths.log_dir = _get_env_path("SILC_LOG_DIR", config.paths.log_dir)
-
-    # TLS overrides
-    config.tls.enabled = _get_env_bool("SILC_TLS_ENABLED", config.tls.enabled)
-    config.tls.cert_path = _get_env_str("SILC_TLS_CERT_PATH", config.tls.cert_path)
-    config.tls.key_path = _get_env_str("SILC_TLS_KEY_PATH", config.tls.key_path)
-
-    # Token overrides
-    config.tokens.length = _get_env_int("SILC_TOKEN_LENGTH", config.tokens.length)
-    config.tokens.require_token = _get_env_bool(
-        "SILC_REQUIRE_TOKEN", config.tokens.require_token
-    )
-
-    # Session overrides
-    config.sessions.default_timeout = _get_env_int(
-        "SILC_COMMAND_TIMEOUT", config.sessions.default_timeout
-    )
-    config.sessions.max_buffer_bytes = _get_env_int(
-        "SILC_MAX_BUFFER_BYTES", config.sessions.max_buffer_bytes
-    )
-    config.sessions.idle_timeout = _get_env_int(
-        "SILC_IDLE_TIMEOUT", config.sessions.idle_timeout
-    )
-    config.sessions.gc_interval = _get_env_int(
-        "SILC_GC_INTERVAL", config.sessions.gc_interval
-    )
-
-    # Logging overrides
-    config.logging.max_log_lines = _get_env_int(
-        "SILC_MAX_LOG_LINES", config.logging.max_log_lines
-    )
-    config.logging.log_level = (
-        _get_env_str("SILC_LOG_LEVEL", config.logging.log_level)
-        or config.logging.log_level
-    )
+    try:
+        with open(config_path, "rb") as f:
+            parsed = tomllib.load(f)
+    except (OSError, tomllib.TOMLDecodeError):
+        return {}
 
-    return config
+    _file_cache = (cache_key, parsed)
+    return parsed
 
 
-def _apply_file_config(config: Config, file_config: dict[str, Any]) -> Config:
-    """Apply configuration from file to config object."""
-    if "ports" in file_config:
-        ports = file_config["ports"]
-        config.ports.daemon_start = ports.get("daemon_start", config.ports.daemon_start)
-        config.ports.daemon_end = ports.get("daemon_end", config.ports.daemon_end)
-        config.ports.session_start = ports.get(
-            "session_start", config.ports.session_start
-        )
-        config.ports.session_end = ports.get("session_end", config.ports.session_end)
-        config.ports.max_attempts = ports.get("max_attempts", config.ports.max_attempts)
-
-    if "paths" in file_config:
-        paths = file_config["paths"]
-        if "data_dir" in paths:
-            config.paths.data_dir = Path(paths["data_dir"])
-        if "log_dir" in paths:
-            config.paths.log_dir = Path(paths["log_dir"])
-
-    if "tls" in file_config:
-        tls = file_config["tls"]
-        config.tls.enabled = tls.get("enabled", config.tls.enabled)
-        config.tls.cert_path = tls.get("cert_path", config.tls.cert_path)
-        config.tls.key_path = tls.get("key_path", config.tls.key_path)
-
-    if "tokens" in file_config:
-        tokens = file_config["tokens"]
-        config.tokens.length = tokens.get("length", config.tokens.length)
-        config.tokens.require_token = tokens.get(
-            "require_token", config.tokens.require_token
-        )
-
-    if "sessions" in file_config:
-        sessions = file_config["sessions"]
-        config.sessions.default_timeout = sessions.get(
-            "default_timeout", config.sessions.default_timeout
-        )
-        config.sessions.max_buffer_bytes = sessions.get(
-            "max_buffer_bytes", config.sessions.max_buffer_bytes
-        )
-        config.sessions.idle_timeout = sessions.get(
-            "idle_timeout", config.sessions.idle_timeout
-        )
-        config.sessions.gc_interval = sessions.get(
-            "gc_interval", config.sessions.gc_interval
-        )
-
-    if "logging" in file_config:
-        logging = file_config["logging"]
-        config.logging.max_log_lines = logging.get(
-            "max_log_lines", config.logging.max_log_lines
-        )
-        config.logging.log_level = logging.get("log_level", config.logging.log_level)
+def _apply_overrides(config: Config, file_config: dict[str, Any]) -> Config:
+    """Apply file values and environment overrides in one combined pass.
 
+    Both sources share the schema in ``_ENV_TABLE``, so each section is
+    rebuilt with at most one ``replace()`` no matter how many sources set
+    values in it. Environment variables win over file values; an env value
+    that fails coercion falls back to the file value for that field.
+    """
+    # Snapshot the SILC_* keys once instead of ~25 os.environ lookups; when
+    # nothing relevant is set anywhere, skip the pass entirely.
+    env = {k: v for k, v in os.environ.items() if k.startswith("SILC_")}
+    if not env and not file_config:
+        return config
+
+    updates: dict[str, Any] = {}
+    for section, fields in _ENV_TABLE.items():
+        file_section = file_config.get(section)
+        section_updates: dict[str, Any] = {}
+        for env_key, field_name, coerce in fields:
+            value = env.get(env_key)
+            if value is not None:
+                coerced = coerce(value)
+                if coerced is not _SKIP:
+                    section_updates[field_name] = coerced
+                    continue
+            if file_section and field_name in file_section:
+                file_value = file_section[field_name]
+                # TOML values are already typed; only paths need converting.
+                if section == "paths":
+                    file_value = Path(file_value)
+                section_updates[field_name] = file_value
+        if section_updates:
+            updates[section] = replace(getattr(config, section), **section_updates)
+
+    if updates:
+        return replace(config, **updates)
     return config
 
 
@@ -282,31 +264,36 @@ def load_config() -> Config:
     """
     config = Config()
 
-    # Apply file config
-    file_config = _load_config_file()
-    if file_config:
-        config = _apply_file_config(config, file_config)
-
-    # Apply environment overrides (highest priority)
-    config = _apply_env_overrides(config)
+    # Read file config (tests/CLI can opt out of disk access entirely)
+    file_config: dict[str, Any] = {}
+    if os.environ.get("SILC_SKIP_CONFIG_FILE") != "1":
+        file_config = _load_config_file()
 
-    return config
+    return _apply_overrides(config, file_config)
 
 
 # Global config instance
 _config: Config | None = None
+_config_lock = threading.Lock()
 
 
 def get_config() -> Config:
     """Get the global configuration instance.
 
+    The instance is built lazily exactly once; concurrent first calls are
+    serialized so threads never observe a half-initialized config.
+
     Returns:
         Config: The configuration object
     """
     global _config
-    if _config is None:
-        _config = load_config()
-    return _config
+    config = _config
+    if config is None:
+        with _config_lock:
+            if _config is None:
+                _config = load_config()
+            config = _config
+    return config
 
 
 def reload_config() -> Config:
@@ -315,9 +302,12 @@ def reload_config() -> Config:
     Returns:
         Config: The reloaded configuration object
     """
-    global _config
-    _config = load_config()
-    return _config
+    global _config, _file_cache, _file_missing
+    with _config_lock:
+        _file_cache = None
+        _file_missing = False
+        _config = load_config()
+        return _config
 
 
 __all__ = [
@@ -11,25 +11,36 @@ ANSI_CONTROL_SEQUENCE = re.compile(
     r"\x1b[PX^_].*?\x1b\\|"
     r"\x1b[@-Z\\-_]"
 )
-PROGRESS_RE = re.compile(r"\d{1,3}%")
 
 
-def clean_output(raw_lines: Iterable[str]) -> str:
-    cleaned: List[str] = []
+def _has_progress(line: str) -> bool:
+    """Detect progress-bar frames: any ``%`` directly preceded by a digit."""
+    index = line.find("%")
+    while index != -1:
+        if index > 0 and "0" <= line[index - 1] <= "9":
+            return True
+        index = line.find("%", index + 1)
+    return False
 
-    for raw_line in raw_lines:
-        line = raw_line
 
-        if "\r" in line:
-            line = line.split("\r")[-1]
+# Deletes C0 control characters (except tab and newline) in one C-level pass.
+_CONTROL_CHAR_TABLE = {code: None for code in range(32) if code not in (9, 10)}
 
-        # Remove ANSI/OSC/control sequences while preserving tabs.
-        line = ANSI_CONTROL_SEQUENCE.sub("", line)
-        line = "".join(char if char == "\t" or char >= " " else "" for char in line)
-        line = line.rstrip()
-        line = line.replace("\r\n", "\n").replace("\r", "\n")
 
-        cleaned.append(line)
+def clean_output(raw_lines: Iterable[str]) -> str:
+    # Resolve carriage returns per line, then strip ANSI/OSC/control
+    # sequences from the joined text in one regex sweep and one translate
+    # instead of restarting the engine for every line.
+    resolved = [
+        line.rsplit("\r", 1)[-1] if "\r" in line else line for line in raw_lines
+    ]
+    blob = "\n".join(resolved)
+    # Cooked-mode output frequently carries no escapes at all; one literal
+    # check then skips the regex sweep entirely.
+    if "\x1b" in blob:
+        blob = ANSI_CONTROL_SEQUENCE.sub("", blob)
+    blob = blob.translate(_CONTROL_CHAR_TABLE)
+    cleaned = [line.rstrip() for line in blob.split("\n")]
 
     cleaned = collapse_progress_bars(cleaned)
 
@@ -52,7 +63,7 @@ def collapse_progress_bars(lines: Iterable[str]) -> List[str]:
     last_progress: str | None = None
 
     for line in lines:
-        if PROGRESS_RE.search(line):
+        if _has_progress(line):
             last_progress = line
             continue
 
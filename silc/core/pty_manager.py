@@ -12,6 +12,22 @@ from typing import Any, Mapping, Optional
 
 from silc.core.constants import DEFAULT_SCREEN_COLUMNS, DEFAULT_SCREEN_ROWS
 
+if sys.platform != "win32":
+    # Imported once here instead of per UnixPTY construction.
+    import fcntl
+    import pty
+    import struct
+    import termios
+
+# Fallback shells resolved once at import; spawning a session should not pay
+# an environment lookup per PTY construction.
+_DEFAULT_UNIX_SHELL = os.environ.get("SHELL") or "/bin/bash"
+_DEFAULT_WINDOWS_SHELL = os.environ.get("COMSPEC") or "cmd.exe"
+
+# Upper bound on how much already-queued output a single read() call will
+# coalesce; keeps latency bounded during sustained bursts.
+_MAX_COALESCE_BYTES = 256 * 1024
+
 
 class PTYBase(ABC):
     """Abstract PTY interface used by SILC session logic."""
@@ -25,7 +41,7 @@ class PTYBase(ABC):
         self.pid: int | None = None
 
     @abstractmethod
-    async def read(self, size: int = 1024) -> bytes: ...
+    async def read(self, size: int = 65536) -> bytes: ...
 
     @abstractmethod
     async def write(self, data: bytes) -> None: ...
@@ -58,7 +74,7 @@ class StubPTY(PTYBase):
     ):
         super().__init__(shell_cmd, env, cwd)
 
-    async def read(self, size: int = 1024) -> bytes:
+    async def read(self, size: int = 65536) -> bytes:
         await asyncio.sleep(0.1)
         return b""
 
@@ -90,15 +106,13 @@ class UnixPTY(PTYBase):
         self, shell_cmd: Optional[str], env: Mapping[str, str], cwd: str | None = None
     ):
         super().__init__(shell_cmd, env, cwd)
-        import fcntl
-        import pty
-        import struct
-        import termios
-
         self._master_fd, slave_fd = pty.openpty()
         self._slave_fd = slave_fd
+        # Non-blocking master: reads are driven by event-loop readiness
+        # callbacks instead of a worker-thread hop per chunk.
+        os.set_blocking(self._master_fd, False)
 
-        shell = shell_cmd or os.environ.get("SHELL", "/bin/bash")
+        shell = shell_cmd or _DEFAULT_UNIX_SHELL
         if isinstance(shell, str):
             args = [shell]
         else:
@@ -116,27 +130,92 @@ class UnixPTY(PTYBase):
         )
         self.pid = self._process.pid
         os.close(slave_fd)
-        self._struct = struct
-        self._termios = termios
-        self._fcntl = fcntl
 
-    async def read(self, size: int = 1024) -> bytes:
+    async def read(self, size: int = 65536) -> bytes:
         loop = asyncio.get_running_loop()
-        try:
-            return await loop.run_in_executor(None, os.read, self._master_fd, size)
-        except OSError:
-            return b""
+        while True:
+            try:
+                data = os.read(self._master_fd, size)
+            except BlockingIOError:
+                try:
+                    await self._wait_for_fd(loop, write=False)
+                except OSError:
+                    return b""
+                continue
+            except OSError:
+                return b""
+            if data:
+                return self._drain_queued(data, size)
+            return data
+
+    def _drain_queued(self, data: bytes, size: int) -> bytes:
+        """Coalesce output that is already queued behind the first chunk.
+
+        The tty driver hands out bursts in small pieces; picking them all up
+        in one pass means one buffer append and one log write per burst
+        instead of per piece.
+        """
+        chunks = [data]
+        total = len(data)
+        while total < _MAX_COALESCE_BYTES:
+            try:
+                more = os.read(self._master_fd, size)
+            except (BlockingIOError, OSError):
+                break
+            if not more:
+                break
+            chunks.append(more)
+            total += len(more)
+        if len(chunks) == 1:
+            return data
+        return b"".join(chunks)
 
     async def write(self, data: bytes) -> None:
         loop = asyncio.get_running_loop()
+        view = memoryview(data)
+        while view:
+            try:
+                written = os.write(self._master_fd, view)
+                view = view[written:]
+            except BlockingIOError:
+                try:
+                    await self._wait_for_fd(loop, write=True)
+                except OSError:
+                    return None
+            except OSError:
+                return None
+
+    async def _wait_for_fd(self, loop: asyncio.AbstractEventLoop, write: bool) -> None:
+        """Suspend until the master fd is ready for the requested operation."""
+        fd = self._master_fd
+        future: asyncio.Future[None] = loop.create_future()
+
+        def _on_ready() -> None:
+            if not future.done():
+                future.set_result(None)
+
+        add = loop.add_writer if write else loop.add_reader
+        remove = loop.remove_writer if write else loop.remove_reader
         try:
-            await loop.run_in_executor(None, os.write, self._master_fd, data)
-        except OSError:
-            return None
+            add(fd, _on_ready)
+        except NotImplementedError:
+            # Event loop without fd watching; poll from a worker thread.
+            import select
+
+            rlist, wlist = ([], [fd]) if write else ([fd], [])
+            await loop.run_in_executor(None, select.select, rlist, wlist, [], 0.1)
+            return
+        try:
+            await future
+        finally:
+            try:
+                remove(fd)
+            except (OSError, ValueError):
+                pass
 
     def resize(self, rows: int, cols: int) -> None:
-        dims = self._struct.pack("HHHH", rows, cols, 0, 0)
-        self._fcntl.ioctl(self._master_fd, self._termios.TIOCSWINSZ, dims)
+        dims = struct.pack("HHHH", rows, cols, 0, 0)
+        fcntl.ioctl(self._master_fd, termios.TIOCSWINSZ, dims)
 
     def kill(self) -> None:
         import psutil
@@ -209,7 +288,7 @@ class WindowsPTY(PTYBase):
         super().__init__(shell_cmd, env, cwd)
         self._pty_handle: Any | None = None
         winpty_module = self._load_winpty_module()
-        command = shell_cmd or os.environ.get("COMSPEC", "cmd.exe")
+        command = shell_cmd or _DEFAULT_WINDOWS_SHELL
         if hasattr(winpty_module, "PtyProcess"):
             self._process = winpty_module.PtyProcess.spawn(
                 command, env=self.env, cwd=self.cwd
@@ -223,7 +302,7 @@ class WindowsPTY(PTYBase):
             raise RuntimeError("winpty/pywinpty does not expose a usable PTY backend.")
         self.pid = getattr(self._process, "pid", None)
 
-    async def read(self, size: int = 1024) -> bytes:
+    async def read(self, size: int = 65536) -> bytes:
         loop = asyncio.get_running_loop()
         try:
             return await loop.run_in_executor(None, self._read_sync, size)
@@ -424,7 +503,10 @@ def create_pty(
 ) -> PTYBase:
     """Factory that returns the best available PTY implementation."""
 
-    env = dict(env or os.environ.copy())
+    if env is None:
+        # PTYBase takes its own copy; hand over the live mapping instead of
+        # duplicating the environment again here.
+        env = os.environ
     if sys.platform == "win32":
         return WindowsPTY(shell_cmd, env, cwd)
     if sys.platform.startswith("linux") or sys.platform == "darwin":
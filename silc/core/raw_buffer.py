@@ -6,37 +6,99 @@ from typing import List, Tuple
 
 
 class RawByteBuffer:
-    """Store PTY bytes along with a cursor so callers can replay ranges."""
+    """Store PTY bytes along with a cursor so callers can replay ranges.
+
+    Storage is a fixed-capacity ring: appends wrap around a preallocated
+    bytearray instead of shifting the whole buffer on every overflow, so an
+    append costs O(len(data)) regardless of how full the buffer is.
+    """
 
     def __init__(self, maxlen: int = 65536) -> None:
         self.maxlen = maxlen
-        self._buffer = bytearray()
+        self._ring = bytearray(maxlen)
+        self._head = 0  # next physical write position
+        self._filled = 0  # bytes currently retained (<= maxlen)
         self._start_offset = 0
         self._total_bytes = 0
         self.cursor = 0
 
     def append(self, data: bytes) -> None:
-        """Add new bytes and trim the buffer to honor maxlen."""
+        """Add new bytes, overwriting the oldest when capacity is exceeded."""
         if not data:
             return
 
-        self._buffer.extend(data)
-        self._total_bytes += len(data)
+        size = len(data)
+        if size >= self.maxlen:
+            # The chunk alone fills the ring; keep only its tail.
+            self._ring[:] = data[-self.maxlen :]
+            self._head = 0
+            self._filled = self.maxlen
+        else:
+            end = self._head + size
+            if end <= self.maxlen:
+                self._ring[self._head : end] = data
+                self._head = end % self.maxlen
+            else:
+                split = self.maxlen - self._head
+                self._ring[self._head :] = data[:split]
+                self._ring[: size - split] = data[split:]
+                self._head = size - split
+            self._filled = min(self.maxlen, self._filled + size)
+
+        self._total_bytes += size
         self.cursor = self._total_bytes
-
-        if len(self._buffer) <= self.maxlen:
-            return
-
-        overflow = len(self._buffer) - self.maxlen
-        del self._buffer[:overflow]
-        self._start_offset += overflow
+        self._start_offset = self._total_bytes - self._filled
+
+    def _read_window(self, count: int) -> bytes:
+        """Materialize the newest ``count`` retained bytes in logical order."""
+        start = (self._head - count) % self.maxlen
+        end = start + count
+        with memoryview(self._ring) as view:
+            if end <= self.maxlen:
+                return bytes(view[start:end])
+            return bytes(view[start:]) + bytes(view[: end - self.maxlen])
+
+    def _tail_count(self, lines: int) -> int:
+        """Size of the newest window covering the last N newline segments.
+
+        Walks newlines backwards over the ring's physical segments without
+        materializing the window, so only the returned tail is ever copied.
+        """
+        start = (self._head - self._filled) % self.maxlen
+        end = start + self._filled
+        if end <= self.maxlen:
+            segments = [(0, start, end)]
+        else:
+            wrap = end - self.maxlen
+            segments = [(0, start, self.maxlen), (self.maxlen - start, 0, wrap)]
+
+        remaining = lines + 1
+        for logical_base, seg_start, seg_end in reversed(segments):
+            pos = seg_end
+            while remaining:
+                found = self._ring.rfind(b"\n", seg_start, pos)
+                if found < 0:
+                    break
+                pos = found
+                remaining -= 1
+                if remaining == 0:
+                    return self._filled - (logical_base + pos - seg_start + 1)
+        return self._filled
 
     def get_last(self, lines: int | None = 100) -> List[str]:
         """Return the decoded text split into the last N logical lines."""
-        if not self._buffer:
+        if not self._filled:
             return []
 
-        decoded = self._buffer.decode("utf-8", errors="replace")
+        # Decode only the tail holding the requested lines. Lone-\r breaks
+        # are still honored by the splitlines below, which can only split
+        # the tail further.
+        if lines is not None and lines > 0:
+            count = self._tail_count(lines)
+        else:
+            count = self._filled
+
+        decoded = self._read_window(count).decode("utf-8", errors="replace")
         split_lines = decoded.splitlines()
         if lines is None or lines >= len(split_lines):
             return split_lines
@@ -50,24 +112,25 @@ class RawByteBuffer:
         if cursor > self._total_bytes:
             cursor = self._total_bytes
 
-        start_index = cursor - self._start_offset
-        start_index = max(start_index, 0)
-        if start_index >= len(self._buffer):
+        count = self._total_bytes - cursor
+        if count <= 0:
             return b"", self._total_bytes
 
-        chunk = bytes(self._buffer[start_index:])
-        return chunk, self._total_bytes
+        return self._read_window(count), self._total_bytes
 
     def clear(self) -> None:
         """Reset the buffer to an empty state."""
-        self._buffer.clear()
+        self._head = 0
+        self._filled = 0
         self._start_offset = 0
         self._total_bytes = 0
         self.cursor = 0
 
     def get_bytes(self) -> bytes:
         """Return a copy of the queued bytes for rehydration."""
-        return bytes(self._buffer)
+        if not self._filled:
+            return b""
+        return self._read_window(self._filled)
 
 
 __all__ = ["RawByteBuffer"]
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import codecs
 import os
 import re
 import sys
-import uuid
+import time
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -25,11 +26,37 @@ from ..core.cleaner import clean_output
 from ..core.constants import DEFAULT_SCREEN_COLUMNS, DEFAULT_SCREEN_ROWS
 from ..core.pty_manager import PTYBase, create_pty
 from ..core.raw_buffer import RawByteBuffer
-from ..utils.persistence import rotate_session_log, write_session_log
+from ..utils.persistence import (
+    LOGGING_DISABLED,
+    rotate_session_log,
+    write_session_log,
+)
 from ..utils.shell_detect import ShellInfo
 
-OSC_BYTE_PATTERN = re.compile(rb"\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)")
-SILC_SENTINEL_PATTERN = re.compile(r"__SILC_(?:BEGIN|END)_\w+__")
+# Byte-level counterpart of cleaner.ANSI_CONTROL_SEQUENCE: strips OSC, CSI,
+# DCS-family, and lone ESC sequences in one sub so the later str-level sweep
+# finds nothing left to do.
+ESCAPE_BYTE_PATTERN = re.compile(
+    rb"\x1b\[[0-9;]*[a-zA-Z]"
+    rb"|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)"
+    rb"|\x1b[PX^_].*?\x1b\\"
+    rb"|\x1b[@-Z\\-_]"
+)
+# Tokens are hex + counter, so ASCII \w suffices and scans faster than the
+# Unicode-aware default.
+SILC_SENTINEL_PATTERN = re.compile(r"__SILC_(?:BEGIN|END)_\w+__", re.ASCII)
+# Byte templates for the per-run markers; the token is spliced in with %
+# so run_command never builds f-strings or re-encodes per invocation.
+_BEGIN_MARKER_TMPL = b"__SILC_BEGIN_%s__"
+_END_PREFIX_TMPL = b"__SILC_END_%s__:"
+
+# The exit status after the END prefix is a plain signed integer; pull it
+# straight from the bytes instead of decoding and filtering per character.
+_EXIT_CODE_PATTERN = re.compile(rb"-?\d+")
+# Maps lone \r to \n; applied after collapsing \r\n so newline
+# normalization happens on bytes, before any decode. 0x0D never occurs
+# inside a UTF-8 multibyte sequence, so this is encoding-safe.
+_CR_TO_LF = bytes.maketrans(b"\r", b"\n")
 HELPER_ECHO_FRAGMENTS = (
     "__silc_exec",
     "__SILC_BEGIN_",
@@ -37,6 +64,14 @@ HELPER_ECHO_FRAGMENTS = (
     'Write-Host "__SILC_',
     "Invoke-Expression $cmd",
 )
+# One alternation covering every helper-echo fragment plus the sentinel
+# markers (the bare BEGIN/END prefixes subsume the full sentinel form), so
+# a prefiltered line needs a single scan instead of five plus a regex.
+HELPER_FILTER_PATTERN = re.compile(
+    r'__silc_exec|__SILC_(?:BEGIN|END)_|Write-Host "__SILC_'
+    r"|Invoke-Expression \$cmd",
+    re.ASCII,
+)
 
 # Security: Cap collected buffer to prevent DoS attacks
 MAX_COLLECTED_BYTES = 5 * 1024 * 1024  # 5MB
@@ -44,7 +79,7 @@ DEFAULT_COMMAND_TIMEOUT = 600  # 10 minutes in seconds
 
 # Buffer and PTY configuration
 DEFAULT_BUFFER_SIZE = 65536  # 64KB buffer for PTY output
-DEFAULT_READ_SIZE = 4096  # Default read chunk size from PTY
+DEFAULT_READ_SIZE = 65536  # Default read chunk size from PTY
 
 # Timing constants (in seconds)
 HELPER_INJECTION_DELAY = 0.5  # Delay after injecting helper function
@@ -72,19 +107,38 @@ class SilcSession:
         self.port = port
         self.name = name
         self.shell_info = shell_info
-        self.session_id = str(uuid.uuid4())[:8]
+        # 8 hex chars, same contract as the old uuid4 slice but without
+        # formatting a 36-char uuid to keep a fifth of it.
+        self.session_id = os.urandom(4).hex()
         self.api_token = api_token
         self.cwd = cwd
-        self.pty: PTYBase = create_pty(shell_info.path, os.environ.copy(), cwd=cwd)
+        self.pty: PTYBase = create_pty(shell_info.path, cwd=cwd)
 
         self.buffer = RawByteBuffer(maxlen=DEFAULT_BUFFER_SIZE)
         self.created_at = datetime.utcnow()
-        self.last_access = datetime.utcnow()
-        self.last_output = datetime.utcnow()
+        # Idle tracking uses monotonic floats: cheap to stamp per PTY packet
+        # and immune to wall-clock jumps. created_at stays a datetime since
+        # it is only formatted for display.
+        self.last_access = time.monotonic()
+        self.last_output = time.monotonic()
 
         self.run_lock = asyncio.Lock()
         self.current_run_cmd: str | None = None
         self.input_lock = asyncio.Lock()
+        # Run tokens only need to be unique within this session, so a
+        # counter on top of the random session_id beats a uuid4 per command.
+        self._run_counter = 0
+
+        # Bytes variant of the prompt pattern lets _wait_for_prompt scan raw
+        # chunks without decoding; shell prompts are ASCII in practice, but
+        # fall back to the str pattern if this one cannot be built.
+        try:
+            self._prompt_pattern_bytes: re.Pattern[bytes] | None = re.compile(
+                shell_info.prompt_pattern.pattern.encode("ascii"),
+                shell_info.prompt_pattern.flags & ~re.UNICODE,
+            )
+        except (UnicodeEncodeError, re.error):
+            self._prompt_pattern_bytes = None
 
         self.screen_columns = DEFAULT_SCREEN_COLUMNS
         self.screen_rows = DEFAULT_SCREEN_ROWS
@@ -92,31 +146,57 @@ class SilcSession:
         self.pty.resize(self.screen_rows, self.screen_columns)
 
         self._read_task: Optional[asyncio.Task[None]] = None
-        self._gc_task: Optional[asyncio.Task[None]] = None
         self._closed = False
         self.tui_active = False
         self._helper_injected = False
+        self._output_subscribers: set[asyncio.Queue[bytes | None]] = set()
+        # Set by _read_loop whenever new bytes land in the buffer, so
+        # consumers wake on data arrival instead of polling on a timer.
+        self._data_event = asyncio.Event()
+        self._gc_handle: asyncio.TimerHandle | None = None
+        self._last_rotated = time.monotonic()
+        # Stateful decoder for the read-loop log; keeps a UTF-8 codepoint
+        # split across two PTY reads from turning into replacement chars.
+        self._log_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        # Raw chunks queued for the background log writer; bounded so a
+        # stalled disk drops log data instead of growing without limit.
+        self._log_queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=512)
+        self._log_task: Optional[asyncio.Task[None]] = None
+        # Last rendered screen, keyed by buffer position and dimensions, so
+        # back-to-back status polls on a quiet session skip the VT replay.
+        self._render_cache: tuple[tuple[int, int, int], list[str]] | None = None
 
     async def start(self) -> None:
         if self._read_task is not None:
             return
         self._read_task = asyncio.create_task(self._read_loop())
+        self._log_task = asyncio.create_task(self._log_writer())
         await asyncio.sleep(0.5)
         await self._inject_helper()
-        self._gc_task = asyncio.create_task(self._garbage_collect())
+        self._gc_handle = asyncio.get_running_loop().call_later(
+            GC_INTERVAL_SECONDS, self._gc_tick
+        )
 
     async def _read_loop(self) -> None:
         consecutive_empty_reads = 0
         while not self._closed:
             try:
-                data = await self.pty.read(4096)
+                data = await self.pty.read(DEFAULT_READ_SIZE)
                 if data:
                     consecutive_empty_reads = 0
                     self.buffer.append(data)
-                    self.last_output = datetime.utcnow()
-                    write_session_log(
-                        self.port, f"OUTPUT: {data.decode('utf-8', errors='replace')}"
-                    )
+                    self._publish_output(data)
+                    self._data_event.set()
+                    self.last_output = time.monotonic()
+                    # Hand the chunk to the background writer; the read loop
+                    # never waits on disk. On overflow the log loses data,
+                    # the session does not. When logging is off nothing is
+                    # queued, so the writer never decodes either.
+                    if not LOGGING_DISABLED:
+                        try:
+                            self._log_queue.put_nowait(data)
+                        except asyncio.QueueFull:
+                            pass
                 else:
                     # Empty read - check if shell process is still alive
                     consecutive_empty_reads += 1
@@ -135,13 +215,83 @@ class SilcSession:
                 write_session_log(self.port, f"Read loop error: {e}")
                 break
 
-    async def _garbage_collect(self) -> None:
-        # GC runs every 60s for log rotation.
+    def subscribe_output(self, maxsize: int = 256) -> asyncio.Queue[bytes | None]:
+        """Register a per-client queue fed by the single read-loop producer.
+
+        Raw PTY bytes are pushed to every subscriber as they arrive, so N
+        viewers share one `get_since` pass instead of polling independently.
+        A ``None`` item signals the subscriber fell too far behind and was
+        dropped; the consumer should disconnect its client.
+        """
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=maxsize)
+        self._output_subscribers.add(queue)
+        return queue
+
+    def unsubscribe_output(self, queue: asyncio.Queue[bytes | None]) -> None:
+        """Remove a queue previously returned by :meth:`subscribe_output`."""
+        self._output_subscribers.discard(queue)
+
+    def _publish_output(self, data: bytes) -> None:
+        stale: list[asyncio.Queue[bytes | None]] = []
+        for queue in self._output_subscribers:
+            try:
+                queue.put_nowait(data)
+            except asyncio.QueueFull:
+                stale.append(queue)
+        for queue in stale:
+            self._output_subscribers.discard(queue)
+            # Make room for the overflow sentinel so the consumer wakes up.
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            try:
+                queue.put_nowait(None)
+            except asyncio.QueueFull:
+                pass
+
+    async def _log_writer(self) -> None:
+        """Drain queued PTY chunks to the session log off the read path.
+
+        Chunks that pile up while a write is in flight are coalesced into a
+        single log entry; the file write itself runs in a worker thread so
+        the event loop never blocks on disk. A ``None`` item shuts it down.
+        """
+        while True:
+            data = await self._log_queue.get()
+            closing = data is None
+            batch: list[bytes] = [] if closing else [data]
+            while not closing:
+                try:
+                    more = self._log_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if more is None:
+                    closing = True
+                    break
+                batch.append(more)
+            if batch:
+                text = self._log_decoder.decode(b"".join(batch))
+                await asyncio.to_thread(write_session_log, self.port, f"OUTPUT: {text}")
+            if closing:
+                return
+
+    def _gc_tick(self) -> None:
+        # GC runs every 60s for log rotation, as a self-rescheduling timer
+        # callback rather than a dedicated task — no coroutine frame sits
+        # parked per session between ticks.
         # Sessions never expire - they stay alive indefinitely.
         # Idle tracking is kept for status/metrics only.
-        while not self._closed:
-            await asyncio.sleep(60)
+        if self._closed:
+            return
+        # Idle sessions produce no output; skip the rotation read/write
+        # when the log cannot have grown since the last pass.
+        if self.last_output > self._last_rotated:
             self.rotate_logs()
+            self._last_rotated = time.monotonic()
+        self._gc_handle = asyncio.get_running_loop().call_later(
+            GC_INTERVAL_SECONDS, self._gc_tick
+        )
 
     async def _ensure_helper_ready(self) -> None:
         if not self._helper_injected:
@@ -157,50 +307,80 @@ class SilcSession:
             await self._wait_for_prompt()
             await asyncio.sleep(0.1)
             self.buffer.clear()
+            self._render_cache = None
         self._helper_injected = True
 
+    async def _wait_for_data(self, deadline: float) -> bool:
+        """Block until ``_read_loop`` signals new output or the deadline hits.
+
+        Callers clear ``_data_event`` before re-checking the buffer, so a
+        chunk appended between the check and this wait wakes us immediately.
+        """
+        remaining = deadline - asyncio.get_running_loop().time()
+        if remaining <= 0:
+            return False
+        try:
+            await asyncio.wait_for(self._data_event.wait(), timeout=remaining)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
     async def _wait_for_prompt(self, timeout: float = 2.0) -> None:
         loop = asyncio.get_running_loop()
         deadline = loop.time() + timeout
         cursor = self.buffer.cursor
-        accumulator = ""
-        pattern = self.shell_info.prompt_pattern
+        accumulator = bytearray()
+        bytes_pattern = self._prompt_pattern_bytes
+        str_pattern = self.shell_info.prompt_pattern
 
         while loop.time() < deadline:
+            self._data_event.clear()
             chunk, cursor = self.buffer.get_since(cursor)
             if chunk:
-                decoded = chunk.decode("utf-8", errors="replace")
-                accumulator += decoded
-                if len(accumulator) > 4096:
-                    accumulator = accumulator[-4096:]
-                if pattern.search(accumulator):
+                accumulator.extend(chunk)
+                if len(accumulator) > MAX_ACCUMULATOR_SIZE:
+                    del accumulator[:-MAX_ACCUMULATOR_SIZE]
+                if bytes_pattern is not None:
+                    if bytes_pattern.search(accumulator):
+                        return
+                elif str_pattern.search(accumulator.decode("utf-8", errors="replace")):
                     return
-            await asyncio.sleep(0.05)
+                continue
+            if not await self._wait_for_data(deadline):
+                return
 
     async def write_input(self, text: str) -> None:
         async with self.input_lock:
             data = text.encode("utf-8", errors="replace")
+            self._data_event.clear()
             await self.pty.write(data)
-            await asyncio.sleep(0.05)
-        self.last_access = datetime.utcnow()
+            # Wait for the echo instead of sleeping a fixed 50 ms; input
+            # that produces no output still releases the lock at the cap.
+            try:
+                await asyncio.wait_for(self._data_event.wait(), timeout=0.05)
+            except asyncio.TimeoutError:
+                pass
+        self.last_access = time.monotonic()
 
     async def clear_screen(self) -> None:
         """Send a clear-screen sequence and refresh the prompt."""
         newline = "\r\n" if sys.platform == "win32" else "\n"
         sequence = f"\x1b[2J\x1b[H{newline}"
         self.buffer.clear()
+        self._render_cache = None
         await self.pty.write(sequence.encode("utf-8", errors="replace"))
-        self.last_access = datetime.utcnow()
-        self.last_output = datetime.utcnow()
+        self.last_access = time.monotonic()
+        self.last_output = time.monotonic()
 
     async def reset_terminal(self) -> None:
         """Reset the terminal state and clear any buffered output."""
         newline = "\r\n" if sys.platform == "win32" else "\n"
         sequence = f"\x1bc{newline}"
         self.buffer.clear()
+        self._render_cache = None
         await self.pty.write(sequence.encode("utf-8", errors="replace"))
-        self.last_access = datetime.utcnow()
-        self.last_output = datetime.utcnow()
+        self.last_access = time.monotonic()
+        self.last_output = time.monotonic()
 
     def get_output(self, lines: int = 100, raw: bool = False) -> str:
         """Get output from the session.
@@ -212,7 +392,7 @@ class SilcSession:
         Returns:
             The requested output as a string
         """
-        self.last_access = datetime.utcnow()
+        self.last_access = time.monotonic()
         if raw:
             snapshot = self.buffer.get_last(lines)
             return "\n".join(snapshot)
@@ -225,25 +405,15 @@ class SilcSession:
         Uses stateless rendering: creates fresh terminal, feeds entire buffer, returns result.
         """
         if Terminal:
-            term = Terminal(self.screen_columns, self.screen_rows)
-            raw_bytes = self.buffer.get_bytes()
-            decoded = raw_bytes.decode("utf-8", errors="replace")
-            term.process_str(decoded)
-
-            content = term.content()
-            rendered_lines = content.split("\n")
-            rendered_lines = [line.rstrip() for line in rendered_lines]
-
-            filtered_lines = []
-            for line in rendered_lines:
-                if any(fragment in line for fragment in HELPER_ECHO_FRAGMENTS):
-                    continue
-                if SILC_SENTINEL_PATTERN.search(line):
-                    continue
-                filtered_lines.append(line)
-
-            while filtered_lines and not filtered_lines[-1].strip():
-                filtered_lines.pop()
+            # The replay only depends on buffer position and dimensions, so
+            # repeated polls on a quiet session reuse the previous render.
+            key = (self.buffer.cursor, self.screen_columns, self.screen_rows)
+            cached = self._render_cache
+            if cached is not None and cached[0] == key:
+                filtered_lines = cached[1]
+            else:
+                filtered_lines = self._render_screen_lines()
+                self._render_cache = (key, filtered_lines)
 
             if lines is not None and lines < len(filtered_lines):
                 filtered_lines = filtered_lines[-lines:]
@@ -254,6 +424,42 @@ class SilcSession:
         output = clean_output(snapshot)
         return self._remove_sentinels(output)
 
+    def _render_screen_lines(self) -> list[str]:
+        """Replay the buffer through a fresh terminal and filter the screen."""
+        term = Terminal(self.screen_columns, self.screen_rows)
+        raw_bytes = self.buffer.get_bytes()
+        # Nothing before a terminal reset or clear+home can affect the
+        # final screen, so start the replay at the last one.
+        cut = max(raw_bytes.rfind(b"\x1bc"), raw_bytes.rfind(b"\x1b[2J\x1b[H"))
+        if cut > 0:
+            raw_bytes = raw_bytes[cut:]
+        decoded = raw_bytes.decode("utf-8", errors="replace")
+        term.process_str(decoded)
+
+        content = term.content()
+
+        # Single pass: rstrip and filter together instead of building an
+        # intermediate rstripped list first.
+        filtered_lines: list[str] = []
+        for line in content.split("\n"):
+            line = line.rstrip()
+            # Literal prefilter: every helper fragment and sentinel
+            # contains one of these substrings, so the vast majority of
+            # lines skip the fragment loop and the regex entirely.
+            if (
+                "__SILC_" in line
+                or "__silc_" in line
+                or "Invoke-Expression $cmd" in line
+            ) and HELPER_FILTER_PATTERN.search(line):
+                continue
+            filtered_lines.append(line)
+
+        # Lines are already rstripped, so trailing blanks are just "".
+        while filtered_lines and not filtered_lines[-1]:
+            filtered_lines.pop()
+
+        return filtered_lines
+
     def resize(self, rows: int, cols: int) -> None:
         """Adjust the PTY and renderer to the new terminal dimensions."""
         rows = max(1, rows)
@@ -265,7 +471,11 @@ class SilcSession:
     def _remove_sentinels(self, text: str) -> str:
         """Remove sentinel marker lines from fallback output."""
         lines = text.split("\n")
-        filtered = [line for line in lines if not SILC_SENTINEL_PATTERN.search(line)]
+        filtered = [
+            line
+            for line in lines
+            if "__SILC_" not in line or not SILC_SENTINEL_PATTERN.search(line)
+        ]
         return "\n".join(filtered)
 
     def rotate_logs(self) -> None:
@@ -284,38 +494,52 @@ class SilcSession:
                 "running_cmd": self.current_run_cmd,
             }
 
+        # No await runs between the locked() check and the acquire below, so
+        # under asyncio the pair is atomic: a concurrent caller always takes
+        # the busy branch above instead of quietly queueing behind us.
         async with self.run_lock:
             self.current_run_cmd = cmd
             await self._ensure_helper_ready()
-            run_token = str(uuid.uuid4())[:8]
+            self._run_counter += 1
+            run_token = f"{self.session_id}{self._run_counter:06x}"
             cursor = self.buffer.cursor
             newline = "\r\n" if sys.platform == "win32" else "\n"
 
             invocation = self.shell_info.build_helper_invocation(cmd, run_token)
             data = (invocation + newline).encode("utf-8", errors="replace")
             await self.pty.write(data)
-            await asyncio.sleep(0.05)
+            # No pacing sleep here: the read loop below blocks on the data
+            # event until the echo arrives anyway.
             write_session_log(self.port, f"COMMAND: {cmd}")
 
             loop = asyncio.get_running_loop()
             deadline = loop.time() + timeout
 
-            begin_marker = f"__SILC_BEGIN_{run_token}__".encode("utf-8")
-            end_prefix = f"__SILC_END_{run_token}__:".encode("utf-8")
+            token_bytes = run_token.encode("ascii")
+            begin_marker = _BEGIN_MARKER_TMPL % token_bytes
+            end_prefix = _END_PREFIX_TMPL % token_bytes
 
             collected = bytearray()
             started = False
+            # Payload start is tracked as an index instead of deleting the
+            # consumed prefix, so finding BEGIN never memmoves the tail.
+            start = 0
+            # Resume the END search where the last pass left off instead of
+            # rescanning collected from the start on every new chunk.
+            end_scan_pos = 0
 
             while loop.time() < deadline:
+                self._data_event.clear()
                 chunk, cursor = self.buffer.get_since(cursor)
                 if not chunk:
-                    await asyncio.sleep(0.05)
+                    if not await self._wait_for_data(deadline):
+                        break
                     continue
 
                 collected.extend(chunk)
 
                 # Security: Cap buffer to prevent DoS attacks
-                if len(collected) > MAX_COLLECTED_BYTES:
+                if len(collected) - start > MAX_COLLECTED_BYTES:
                     await self.pty.write(b"\x03")  # Send Ctrl+C
                     await asyncio.sleep(INTERRUPT_DELAY)
                     self.current_run_cmd = None
@@ -332,50 +556,51 @@ class SilcSession:
                         excess = len(collected) - len(begin_marker)
                         if excess > 0:
                             del collected[:excess]
-                        await asyncio.sleep(0.05)
                         continue
 
-                    del collected[: begin_index + len(begin_marker)]
+                    start = begin_index + len(begin_marker)
                     started = True
-                    while collected and collected[0] in (10, 13):
-                        del collected[0]
+                    while start < len(collected) and collected[start] in (10, 13):
+                        start += 1
+                    end_scan_pos = start
 
-                end_index = collected.find(end_prefix)
+                end_index = collected.find(end_prefix, end_scan_pos)
                 if end_index < 0:
-                    await asyncio.sleep(0.05)
+                    # Back up so a prefix split across chunks is still found.
+                    end_scan_pos = max(start, len(collected) - len(end_prefix) + 1)
                     continue
+                end_scan_pos = end_index
 
                 tail = collected[end_index + len(end_prefix) :]
-                newline_index: int | None = None
-                for idx, byte in enumerate(tail):
-                    if byte in (10, 13):
-                        newline_index = idx
-                        break
+                # C-level scan for the terminator instead of a byte-by-byte
+                # Python loop.
+                nl = tail.find(b"\n")
+                cr = tail.find(b"\r")
+                if nl < 0:
+                    newline_index = cr if cr >= 0 else None
+                elif cr < 0:
+                    newline_index = nl
+                else:
+                    newline_index = min(nl, cr)
 
                 if newline_index is None:
-                    await asyncio.sleep(0.05)
                     continue
 
-                exit_text = tail[:newline_index].decode("ascii", errors="ignore")
-                exit_digits = "".join(
-                    ch for ch in exit_text if ch.isdigit() or ch == "-"
-                )
-                exit_code = 0
-                if exit_digits:
-                    try:
-                        exit_code = int(exit_digits)
-                    except ValueError:
-                        exit_code = 0
-
-                output_bytes = bytes(collected[:end_index])
-                output_bytes = OSC_BYTE_PATTERN.sub(b"", output_bytes)
+                exit_match = _EXIT_CODE_PATTERN.search(tail, 0, newline_index)
+                exit_code = int(exit_match.group()) if exit_match else 0
+
+                output_bytes = bytes(collected[start:end_index])
+                if b"\x1b" in output_bytes:
+                    output_bytes = ESCAPE_BYTE_PATTERN.sub(b"", output_bytes)
+                output_bytes = output_bytes.replace(b"\r\n", b"\n").translate(_CR_TO_LF)
                 output_text = output_bytes.decode("utf-8", errors="replace")
-                output_text = output_text.replace("\r\n", "\n").replace("\r", "\n")
-                raw_lines = [
+                # Generator keeps the sentinel filter lazy; clean_output
+                # makes its single pass without an intermediate list.
+                raw_lines = (
                     line
                     for line in output_text.split("\n")
-                    if not SILC_SENTINEL_PATTERN.search(line)
-                ]
+                    if "__SILC_" not in line or not SILC_SENTINEL_PATTERN.search(line)
+                )
 
                 await asyncio.sleep(0.05)
                 self.current_run_cmd = None
@@ -386,19 +611,18 @@ class SilcSession:
                 }
 
             chunk, _ = self.buffer.get_since(cursor)
-            fallback_bytes = bytes(collected)
             if chunk:
-                fallback_bytes += chunk
-            fallback_text = (
-                fallback_bytes.decode("utf-8", errors="replace")
-                .replace("\r\n", "\n")
-                .replace("\r", "\n")
-            )
-            fallback_lines = [
+                # Extend in place so the tail is materialized once instead
+                # of copy-then-concatenate.
+                collected.extend(chunk)
+            fallback_bytes = bytes(collected[start:])
+            fallback_bytes = fallback_bytes.replace(b"\r\n", b"\n").translate(_CR_TO_LF)
+            fallback_text = fallback_bytes.decode("utf-8", errors="replace")
+            fallback_lines = (
                 line
                 for line in fallback_text.split("\n")
-                if not SILC_SENTINEL_PATTERN.search(line)
-            ]
+                if "__SILC_" not in line or not SILC_SENTINEL_PATTERN.search(line)
+            )
             self.current_run_cmd = None
             return {
                 "output": clean_output(fallback_lines),
@@ -407,7 +631,7 @@ class SilcSession:
             }
 
     def get_status(self) -> dict:
-        self.last_access = datetime.utcnow()
+        self.last_access = time.monotonic()
         rendered_output = self.get_output(lines=1)
         last_line = ""
         rendered_lines = rendered_output.splitlines()
@@ -419,7 +643,7 @@ class SilcSession:
             "port": self.port,
             "name": self.name,
             "alive": self._read_task is not None and not self._read_task.done(),
-            "idle_seconds": (datetime.utcnow() - self.last_output).seconds,
+            "idle_seconds": int(time.monotonic() - self.last_output),
             "waiting_for_input": waiting,
             "last_line": last_line,
             "run_locked": self.run_lock.locked(),
@@ -438,6 +662,7 @@ class SilcSession:
 
     async def clear_buffer(self) -> None:
         self.buffer.clear()
+        self._render_cache = None
 
     async def close(self) -> None:
         if self._closed:
@@ -445,14 +670,21 @@ class SilcSession:
 
         self._closed = True
         self.tui_active = False
+        if self._gc_handle is not None:
+            self._gc_handle.cancel()
+            self._gc_handle = None
 
         tasks: list[asyncio.Task[None]] = []
         if self._read_task:
             self._read_task.cancel()
             tasks.append(self._read_task)
-        if self._gc_task:
-            self._gc_task.cancel()
-            tasks.append(self._gc_task)
+        if self._log_task:
+            # Sentinel lets the writer flush anything it already holds.
+            try:
+                self._log_queue.put_nowait(None)
+            except asyncio.QueueFull:
+                self._log_task.cancel()
+            tasks.append(self._log_task)
 
         # Kill the PTY first to unblock any pending reads.
         self.pty.kill()
@@ -467,18 +699,21 @@ class SilcSession:
                 pass
 
         self._read_task = None
-        self._gc_task = None
+        self._log_task = None
 
     async def force_kill(self) -> None:
         self._closed = True
+        if self._gc_handle is not None:
+            self._gc_handle.cancel()
+            self._gc_handle = None
 
         tasks: list[asyncio.Task[None]] = []
         if self._read_task:
             self._read_task.cancel()
             tasks.append(self._read_task)
-        if self._gc_task:
-            self._gc_task.cancel()
-            tasks.append(self._gc_task)
+        if self._log_task:
+            self._log_task.cancel()
+            tasks.append(self._log_task)
 
         self.pty.kill()
 
@@ -491,7 +726,7 @@ class SilcSession:
                 pass
 
         self._read_task = None
-        self._gc_task = None
+        self._log_task = None
 
 
 __all__ = ["SilcSession", "DEFAULT_SCREEN_COLUMNS", "DEFAULT_SCREEN_ROWS"]
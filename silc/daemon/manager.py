@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import logging.handlers
 import os
+import queue
 import signal
 import socket
 import sys
@@ -37,19 +39,53 @@ from silc.utils.persistence import (
 from silc.utils.ports import bind_port, find_available_port
 from silc.utils.shell_detect import detect_shell
 
+# uvloop ships with uvicorn[standard] on POSIX. Installing its policy at
+# import time — before any entry point calls asyncio.run — puts the daemon
+# loop and every session server on the libuv implementation; Windows and
+# minimal installs fall back to the stdlib loop.
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - Windows / minimal installs
+    pass
+else:
+    # Policy form rather than uvloop.install(), which warns on Python 3.12+.
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
-def setup_uvicorn_logging():
-    """Configure uvicorn logging to write to daemon log file."""
-    logger = logging.getLogger("uvicorn")
-    logger.setLevel(logging.INFO)
 
-    handler = logging.FileHandler(DAEMON_LOG, mode="a", encoding="utf-8")
-    handler.setLevel(logging.INFO)
+# Keeps the listener (and its writer thread) alive for the daemon's lifetime
+# and guards against attaching duplicate handlers on repeated setup calls.
+_uvicorn_log_listener: logging.handlers.QueueListener | None = None
+
+
+def setup_uvicorn_logging():
+    """Configure uvicorn logging to write to daemon log file.
+
+    Handlers on uvicorn's loggers run on the event loop thread, so the file
+    handler sits behind a queue: request handling only enqueues the record
+    and the blocking write happens on the listener's own thread.
+    """
+    global _uvicorn_log_listener
+    if _uvicorn_log_listener is not None:
+        return
+
+    file_handler = logging.FileHandler(DAEMON_LOG, mode="a", encoding="utf-8")
+    file_handler.setLevel(logging.INFO)
     formatter = logging.Formatter(
         "[%(asctime)s] %(name)s - %(levelname)s - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
-    handler.setFormatter(formatter)
+    file_handler.setFormatter(formatter)
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    handler = logging.handlers.QueueHandler(log_queue)
+    handler.setLevel(logging.INFO)
+    _uvicorn_log_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, respect_handler_level=True
+    )
+    _uvicorn_log_listener.start()
+
+    logger = logging.getLogger("uvicorn")
+    logger.setLevel(logging.INFO)
     logger.addHandler(handler)
 
     access_logger = logging.getLogger("uvicorn.access")
@@ -219,8 +255,9 @@ class SilcDaemon:
                         shell_info.type,
                         is_global=is_global,
                     )
-                    # Persist to sessions.json
-                    append_session_to_json(
+                    # Persist to sessions.json off the event loop
+                    await asyncio.to_thread(
+                        append_session_to_json,
                         {
                             "port": selected_port,
                             "name": session_name,
@@ -229,7 +266,7 @@ class SilcDaemon:
                             "is_global": is_global,
                             "cwd": cwd,
                             "created_at": entry.created_at.isoformat() + "Z",
-                        }
+                        },
                     )
 
                     server = self._create_session_server(session, is_global=is_global)
@@ -380,10 +417,7 @@ class SilcDaemon:
             if entry:
                 is_global = getattr(entry, "is_global", False)
 
-            # Get the socket before cleanup (we'll reuse it)
-            session_socket = self._session_sockets.get(port)
-
-            # Kill the old session but keep the socket
+            # Kill the old session
             try:
                 await asyncio.wait_for(session.force_kill(), timeout=1.0)
             except asyncio.TimeoutError:
@@ -398,17 +432,25 @@ class SilcDaemon:
             # Remove from sessions dict but NOT from registry (we're keeping the identity)
             self.sessions.pop(port, None)
 
-            # Cancel the old server task
+            # Stop the old server via uvicorn's own exit path: its shutdown
+            # is what closes the loop-level listener (uvloop serves from a
+            # dup of our socket, so cancelling the task alone leaks it).
+            # wait_for falls back to cancellation if it does not exit.
             old_task = self._session_tasks.pop(port, None)
+            old_server = self.servers.pop(port, None)
+            if old_server:
+                old_server.should_exit = True
             if old_task:
-                old_task.cancel()
                 try:
-                    await asyncio.wait_for(old_task, timeout=1.0)
+                    await asyncio.wait_for(old_task, timeout=2.0)
                 except (asyncio.CancelledError, asyncio.TimeoutError):
                     pass
 
-            # Remove old server
-            self.servers.pop(port, None)
+            # Always rebind: a socket whose server already shut down cannot
+            # be handed to a new uvicorn server on uvloop. SO_REUSEADDR in
+            # bind_port makes the immediate rebind safe.
+            self._close_session_socket(port)
+            session_socket = None
 
             # Create new session with same properties
             try:
@@ -432,8 +474,9 @@ class SilcDaemon:
                     is_global=is_global,
                 )
 
-                # Update sessions.json
-                append_session_to_json(
+                # Update sessions.json off the event loop
+                await asyncio.to_thread(
+                    append_session_to_json,
                     {
                         "port": port,
                         "name": name,
@@ -442,7 +485,7 @@ class SilcDaemon:
                         "is_global": is_global,
                         "cwd": cwd,
                         "created_at": datetime.utcnow().isoformat() + "Z",
-                    }
+                    },
                 )
 
                 # Reuse existing socket or create new one
@@ -596,6 +639,9 @@ class SilcDaemon:
             port=session.port,
             log_level="info",
             access_log=True,
+            # Terminal bytes are fanned out to every viewer from one producer;
+            # per-client deflate would re-add O(clients) compression CPU.
+            ws_per_message_deflate=False,
         )
         return uvicorn.Server(config)
 
@@ -783,29 +829,31 @@ class SilcDaemon:
         task = self._session_tasks.pop(port, None)
         server = self.servers.pop(port, None)
 
-        # Ask server to exit first
+        # Ask uvicorn to exit on its own and wait for it (bounded): its
+        # shutdown path is what closes the loop-level listener. Cancelling
+        # the serve task first skips that, and on uvloop — which serves from
+        # a dup of our socket — the listener then keeps accepting after the
+        # session is gone. wait_for cancels the task if it does not exit.
         if server:
             server.should_exit = True
-
-        # Close listening socket early so the port is released even if uvicorn is stuck.
-        self._close_session_socket(port)
-
-        # Cancel and await the task (bounded)
         if task:
-            task.cancel()
             try:
                 await asyncio.wait_for(task, timeout=2.0)
             except asyncio.CancelledError:
                 pass
             except asyncio.TimeoutError:
                 write_daemon_log(
-                    f"Timeout waiting for session server task to cancel: port={port}"
+                    f"Timeout waiting for session server to exit: port={port}"
                 )
             except Exception as exc:
                 write_daemon_log(
                     f"Error awaiting session server task during cleanup: port={port}, error={exc}"
                 )
 
+        # Release our handle on the listening socket so the port frees even
+        # if uvicorn was stuck and had to be cancelled.
+        self._close_session_socket(port)
+
         # Close session (this should kill PTY processes)
         session = self.sessions.pop(port, None)
         if session:
@@ -822,8 +870,8 @@ class SilcDaemon:
         # Remove from registry
         self.registry.remove(port)
 
-        # Remove from persistent registry
-        remove_session_from_json(port)
+        # Remove from persistent registry off the event loop
+        await asyncio.to_thread(remove_session_from_json, port)
 
         # Cleanup log
         cleanup_session_log(port)
@@ -927,8 +975,9 @@ class SilcDaemon:
                 )
                 write_daemon_log(f"Resurrected: {name} on port {port}")
 
-                # Update sessions.json with actual port
-                append_session_to_json(
+                # Update sessions.json with actual port, off the event loop
+                await asyncio.to_thread(
+                    append_session_to_json,
                     {
                         "port": port,
                         "name": name,
@@ -937,7 +986,7 @@ class SilcDaemon:
                         "is_global": is_global,
                         "cwd": cwd,
                         "created_at": registry_entry.created_at.isoformat() + "Z",
-                    }
+                    },
                 )
 
             except Exception as exc:
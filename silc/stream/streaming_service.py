@@ -144,9 +144,13 @@ class StreamingService:
         """
         while True:
             try:
-                # Get current buffer lines
+                # Get current buffer lines; RawByteBuffer.get_last already
+                # returns split lines, so only re-split legacy str payloads.
                 buffer_content = self.session.buffer.get_last(config.window_size)
-                new_lines = buffer_content.splitlines()
+                if isinstance(buffer_content, str):
+                    new_lines = buffer_content.splitlines()
+                else:
+                    new_lines = list(buffer_content)
 
                 # Read existing file tail
                 existing_lines = await self._read_file_tail(
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import atexit
 import json
 import os
+import queue
 import sys
 import tempfile
+import threading
 from pathlib import Path
 
 from silc.config import get_config
@@ -87,6 +90,8 @@ def rotate_daemon_log(max_lines: int | None = None) -> None:
 
         max_lines = get_config().logging.max_log_lines
 
+    # Land any buffered entries first so rotation sees the full file.
+    flush_daemon_log()
     if not DAEMON_LOG.exists():
         return
     lines = DAEMON_LOG.read_text(encoding="utf-8").splitlines()
@@ -104,20 +109,88 @@ def cleanup_session_log(port: int) -> None:
         pass
 
 
+# Checked once at import: SILC_DISABLE_LOG=1 turns file logging into a no-op
+# so hot paths skip the formatting and disk writes entirely.
+LOGGING_DISABLED = os.environ.get("SILC_DISABLE_LOG") == "1"
+
+
+# Daemon log entries are handed to a background thread instead of being
+# appended inline: the daemon logs from async handlers, and an open+write
+# per message would block the event loop on disk for every line. The worker
+# coalesces whatever queued up while the previous write was in flight into
+# a single append. It starts lazily, so short-lived CLI processes that
+# never log to the daemon file never spawn it.
+_daemon_log_queue: queue.Queue[str | None] = queue.Queue()
+_daemon_log_thread: threading.Thread | None = None
+_daemon_log_lock = threading.Lock()
+
+
+def _daemon_log_worker() -> None:
+    while True:
+        entry = _daemon_log_queue.get()
+        closing = entry is None
+        entries: list[str] = [] if closing else [entry]
+        while not closing:
+            try:
+                more = _daemon_log_queue.get_nowait()
+            except queue.Empty:
+                break
+            if more is None:
+                closing = True
+                break
+            entries.append(more)
+        if entries:
+            try:
+                with open(DAEMON_LOG, "a", encoding="utf-8") as f:
+                    f.writelines(entries)
+            except OSError:
+                pass
+        if closing:
+            return
+
+
+def _ensure_daemon_log_worker() -> None:
+    global _daemon_log_thread
+    if _daemon_log_thread is not None and _daemon_log_thread.is_alive():
+        return
+    with _daemon_log_lock:
+        if _daemon_log_thread is None or not _daemon_log_thread.is_alive():
+            _daemon_log_thread = threading.Thread(
+                target=_daemon_log_worker, name="silc-daemon-log", daemon=True
+            )
+            _daemon_log_thread.start()
+
+
+def flush_daemon_log(timeout: float = 2.0) -> None:
+    """Write out any buffered daemon log entries and stop the worker.
+
+    Safe to call when the worker never started; a later write restarts it.
+    """
+    thread = _daemon_log_thread
+    if thread is None or not thread.is_alive():
+        return
+    _daemon_log_queue.put(None)
+    thread.join(timeout)
+
+
+atexit.register(flush_daemon_log)
+
+
 def write_daemon_log(message: str) -> None:
-    """Append to daemon log."""
+    """Queue a daemon log entry for the background writer."""
+    if LOGGING_DISABLED:
+        return
     import datetime
 
     timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    try:
-        with open(DAEMON_LOG, "a", encoding="utf-8") as f:
-            f.write(f"[{timestamp}] {message}\n")
-    except OSError:
-        pass
+    _ensure_daemon_log_worker()
+    _daemon_log_queue.put(f"[{timestamp}] {message}\n")
 
 
 def write_session_log(port: int, message: str) -> None:
     """Append to session log."""
+    if LOGGING_DISABLED:
+        return
     import datetime
 
     timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -164,66 +237,96 @@ def read_session_log(port: int, tail_lines: int | None = None) -> str:
 # Session persistence for resurrect feature
 SESSIONS_FILE = DATA_DIR / "sessions.json"
 
+# The parsed session list is cached keyed by (path, mtime), the same shape
+# as the config-file cache, so the daemon — the registry's only writer —
+# does its read-modify-write cycles in memory and only pays the JSON parse
+# when the file actually changed underneath it. The re-entrant lock keeps
+# a read-modify-write atomic when registry updates run in worker threads.
+_sessions_cache: tuple[tuple[str, int], list[dict]] | None = None
+_sessions_lock = threading.RLock()
+
 
 def read_sessions_json() -> list[dict]:
     """Read sessions.json, return empty list if not exists or invalid."""
-    if not SESSIONS_FILE.exists():
-        return []
-    try:
-        content = SESSIONS_FILE.read_text(encoding="utf-8")
-        data = json.loads(content)
-        return data.get("sessions", [])
-    except (json.JSONDecodeError, OSError):
-        return []
+    global _sessions_cache
+    with _sessions_lock:
+        try:
+            mtime_ns = SESSIONS_FILE.stat().st_mtime_ns
+        except OSError:
+            return []
+        cache_key = (str(SESSIONS_FILE), mtime_ns)
+        if _sessions_cache is not None and _sessions_cache[0] == cache_key:
+            return list(_sessions_cache[1])
+        try:
+            content = SESSIONS_FILE.read_text(encoding="utf-8")
+            data = json.loads(content)
+            sessions = data.get("sessions", [])
+        except (json.JSONDecodeError, OSError):
+            return []
+        _sessions_cache = (cache_key, sessions)
+        return list(sessions)
 
 
 def write_sessions_json(sessions: list[dict]) -> None:
     """Write sessions list to sessions.json atomically."""
+    global _sessions_cache
     SESSIONS_FILE.parent.mkdir(parents=True, exist_ok=True)
     data = {"sessions": sessions}
-    # Write to temp file then rename for atomicity
-    temp_file = SESSIONS_FILE.with_suffix(".tmp")
-    try:
-        temp_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
-        temp_file.rename(SESSIONS_FILE)
-    except OSError:
-        # Fallback: direct write if rename fails (Windows edge case)
-        SESSIONS_FILE.write_text(json.dumps(data, indent=2), encoding="utf-8")
-    finally:
+    with _sessions_lock:
+        # Write to temp file then rename for atomicity
+        temp_file = SESSIONS_FILE.with_suffix(".tmp")
+        try:
+            temp_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            temp_file.rename(SESSIONS_FILE)
+        except OSError:
+            # Fallback: direct write if rename fails (Windows edge case)
+            SESSIONS_FILE.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        finally:
+            try:
+                temp_file.unlink()
+            except OSError:
+                pass
         try:
-            temp_file.unlink()
+            mtime_ns = SESSIONS_FILE.stat().st_mtime_ns
         except OSError:
-            pass
+            _sessions_cache = None
+        else:
+            _sessions_cache = ((str(SESSIONS_FILE), mtime_ns), list(sessions))
 
 
 def append_session_to_json(session: dict) -> None:
     """Append a session entry to sessions.json."""
-    sessions = read_sessions_json()
-    # Remove any existing entry with same port or name
-    sessions = [
-        s
-        for s in sessions
-        if s.get("port") != session.get("port") and s.get("name") != session.get("name")
-    ]
-    sessions.append(session)
-    write_sessions_json(sessions)
+    with _sessions_lock:
+        sessions = read_sessions_json()
+        # Remove any existing entry with same port or name
+        sessions = [
+            s
+            for s in sessions
+            if s.get("port") != session.get("port")
+            and s.get("name") != session.get("name")
+        ]
+        sessions.append(session)
+        write_sessions_json(sessions)
 
 
 def remove_session_from_json(port: int) -> None:
     """Remove a session entry by port from sessions.json."""
-    sessions = read_sessions_json()
-    sessions = [s for s in sessions if s.get("port") != port]
-    write_sessions_json(sessions)
+    with _sessions_lock:
+        sessions = read_sessions_json()
+        sessions = [s for s in sessions if s.get("port") != port]
+        write_sessions_json(sessions)
 
 
 __all__ = [
     "DATA_DIR",
     "LOGS_DIR",
     "DAEMON_LOG",
+    "LOGGING_DISABLED",
     "SESSIONS_FILE",
     "get_session_log_path",
     "rotate_daemon_log",
     "cleanup_session_log",
+    "flush_daemon_log",
     "write_daemon_log",
     "write_session_log",
     "rotate_session_log",